@@ -3,45 +3,36 @@ from typing import Optional
 from fastapi import HTTPException, Header
 import base64
 import json
+from functools import lru_cache
+
+try:
+    # orjson은 bytes를 바로 파싱하며 표준 json보다 빠릅니다 (JSONDecodeError는 ValueError 하위 클래스)
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
-async def get_current_user_id(
-    authorization: Optional[str] = Header(None)
-) -> str:
+@lru_cache(maxsize=4096)
+def _decode_user_id(token: str) -> str:
     """
-    Authorization 헤더에서 Supabase JWT 토큰을 추출하고 user_id를 반환합니다.
+    JWT 토큰의 payload를 디코딩하여 user_id('sub')를 반환합니다.
+    
+    같은 토큰이 반복해서 들어오는 경우가 많으므로 토큰 문자열별로 결과를 캐시합니다.
+    (예외가 발생한 경우는 캐시되지 않습니다.)
     
     Args:
-        authorization: Authorization 헤더 값 (Bearer {token} 형식)
+        token: Bearer 접두사를 제거한 JWT 토큰
     
     Returns:
         user_id (UUID 문자열)
     
     Raises:
-        HTTPException: 인증 토큰이 없거나 유효하지 않은 경우
-    
-    Note:
-        JWT 토큰의 payload를 디코딩하여 user_id를 추출합니다.
-        프로덕션 환경에서는 토큰 서명 검증을 추가로 수행해야 합니다.
+        HTTPException: 토큰 형식이 유효하지 않거나 user_id가 없는 경우
     """
-    if not authorization or not authorization.startswith("Bearer "):
-        raise HTTPException(
-            status_code=401,
-            detail="인증 토큰이 필요합니다. Authorization 헤더에 Bearer 토큰을 포함해주세요."
-        )
-    
-    token = authorization.replace("Bearer ", "").strip()
-    
-    if not token:
-        raise HTTPException(
-            status_code=401,
-            detail="인증 토큰이 유효하지 않습니다."
-        )
-    
     try:
         # JWT 토큰은 base64로 인코�된 3개의 부분으로 구성됩니다: header.payload.signature
         parts = token.split(".")
@@ -55,14 +46,12 @@ async def get_current_user_id(
         # payload 부분 디코딩
         payload_part = parts[1]
         
-        # base64 패딩 추가 (필요한 경우)
-        padding = 4 - len(payload_part) % 4
-        if padding != 4:
-            payload_part += "=" * padding
+        # base64 패딩 추가 (필요한 경우, 이미 4의 배수면 빈 문자열)
+        payload_part += "=" * (-len(payload_part) & 3)
         
         # base64 디코딩
         decoded_bytes = base64.urlsafe_b64decode(payload_part)
-        payload = json.loads(decoded_bytes)
+        payload = _json_loads(decoded_bytes)
         
         # user_id 추출 (Supabase JWT의 경우 'sub' 필드에 user_id가 있음)
         user_id = payload.get("sub")
@@ -89,3 +78,39 @@ async def get_current_user_id(
             status_code=401,
             detail="인증 처리 중 오류가 발생했습니다."
         )
+
+
+async def get_current_user_id(
+    authorization: Optional[str] = Header(None)
+) -> str:
+    """
+    Authorization 헤더에서 Supabase JWT 토큰을 추출하고 user_id를 반환합니다.
+    
+    Args:
+        authorization: Authorization 헤더 값 (Bearer {token} 형식)
+    
+    Returns:
+        user_id (UUID 문자열)
+    
+    Raises:
+        HTTPException: 인증 토큰이 없거나 유효하지 않은 경우
+    
+    Note:
+        JWT 토큰의 payload를 디코딩하여 user_id를 추출합니다.
+        프로덕션 환경에서는 토큰 서명 검증을 추가로 수행해야 합니다.
+    """
+    if not authorization or not authorization.startswith("Bearer "):
+        raise HTTPException(
+            status_code=401,
+            detail="인증 토큰이 필요합니다. Authorization 헤더에 Bearer 토큰을 포함해주세요."
+        )
+    
+    token = authorization.replace("Bearer ", "").strip()
+    
+    if not token:
+        raise HTTPException(
+            status_code=401,
+            detail="인증 토큰이 유효하지 않습니다."
+        )
+    
+    return _decode_user_id(token)
@@ -1,6 +1,8 @@
 """Repository 인스턴스 관리
 모든 Repository를 싱글톤 패턴으로 관리
 """
+from functools import lru_cache
+
 from repositories import ai_memory_repository
 from repositories import edge_repository
 from repositories import node_repository
@@ -19,10 +21,7 @@ class Repositories:
         self.site_evaluation = site_evaluation_repository
 
 
-# 싱글톤 인스턴스
-_repositories_instance: Repositories = None
-
-
+@lru_cache(maxsize=1)
 def get_repositories() -> Repositories:
     """
     Repository 인스턴스 반환 (싱글톤)
@@ -30,7 +29,4 @@ def get_repositories() -> Repositories:
     Returns:
         Repositories 인스턴스
     """
-    global _repositories_instance
-    if _repositories_instance is None:
-        _repositories_instance = Repositories()
-    return _repositories_instance
+    return Repositories()
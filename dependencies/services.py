@@ -1,6 +1,8 @@
 """Service 인스턴스 관리
 Repository를 주입하여 Service 인스턴스 생성
 """
+from functools import lru_cache
+
 from dependencies.repositories import get_repositories
 from services.ai_service import AiService
 from services.edge_service import EdgeService
@@ -24,21 +26,14 @@ class Services:
         self.site_evaluation = SiteEvaluationService(repositories.site_evaluation)
 
 
-# 싱글톤 인스턴스
-_services_instance: Services = None
-
-
-def get_services(repositories=None) -> Services:
+@lru_cache(maxsize=1)
+def get_services() -> Services:
     """
-    Service 인스턴스 반환 (싱글톤)
+    Service 인스턴스 반환 (싱글톤, 싱글톤 Repository 사용)
     
-    Args:
-        repositories: Repository 인스턴스 (기본값: None, 싱글톤 사용)
+    다른 Repository를 주입해야 하는 경우 Services(repositories)를 직접 생성합니다.
     
     Returns:
         Services 인스턴스
     """
-    global _services_instance
-    if _services_instance is None:
-        _services_instance = Services(repositories)
-    return _services_instance
+    return Services()
@@ -1,155 +1,294 @@
-from typing import Dict, Any
+import math
+import re
+from itertools import islice
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 
-def evaluate_after_action(edge_data: Dict[str, Any], prev_node_data: Dict[str, Any], next_node_data: Dict[str, Any]) -> Dict[str, Any]:
+_NAME_RE = re.compile(r'name=(.*?)(?:\s|$)')
+
+Element = Dict[str, Any]
+Rect = Dict[str, float]
+# (element, 소문자화된 text/aria_label/title 결합 문자열)
+SearchBlob = List[Tuple[Element, str]]
+# (by_id, by_class, by_name, search_blob) — 각 dict는 키 → 목록상 첫 위치
+ElementIndex = Tuple[Dict[str, int], Dict[str, int], Dict[str, int], SearchBlob]
+
+# 필드 경계를 넘는 부분 일치를 막기 위한 구분자 (target에는 등장하지 않음)
+_FIELD_SEP = "\x00"
+
+
+def _parse_target_name(target: str) -> str:
+    """"prop=value" 형식의 target 문자열에서 name 값을 추출합니다. 형식이 아니면 target 그대로 반환."""
+    if "name=" in target:
+        match = _NAME_RE.search(target)
+        if match:
+            return match.group(1).strip()
+    return target
+
+
+def _build_search_blob(elements: List[Element]) -> SearchBlob:
+    """요소별 접근 가능한 이름(text, aria_label, title)을 소문자로 한 번만 결합해 둡니다."""
+    return [
+        (el, _FIELD_SEP.join((
+            (el.get('text') or "").strip(),
+            (el.get('aria_label') or "").strip(),
+            (el.get('title') or "").strip(),
+        )).lower())
+        for el in elements
+    ]
+
+
+def _build_element_index(elements: List[Element]) -> ElementIndex:
+    """
+    요소 목록으로부터 id / class 토큰 / 접근 가능한 이름별 첫 위치 인덱스와
+    부분 일치 탐색용 search blob을 생성합니다. 이름은 소문자로 색인합니다.
+
+    Returns:
+        tuple: (by_id, by_class, by_name, search_blob)
+    """
+    by_id: Dict[str, int] = {}
+    by_class: Dict[str, int] = {}
+    by_name: Dict[str, int] = {}
+    for pos, el in enumerate(elements):
+        el_id = el.get('id')
+        if el_id:
+            by_id.setdefault(el_id, pos)
+        el_class = el.get('class')
+        if el_class and isinstance(el_class, str):
+            for token in el_class.split():
+                by_class.setdefault(token, pos)
+        for field in ('text', 'aria_label', 'title'):
+            name = (el.get(field) or "").strip()
+            if name:
+                by_name.setdefault(name.lower(), pos)
+    return by_id, by_class, by_name, _build_search_blob(elements)
+
+
+def _scan_action_element(target: str, search_blob: Iterable[Tuple[Element, str]]) -> Optional[Element]:
+    """요소 목록을 순차 탐색하여 target과 (이름은 대소문자 무시) 일치하는 첫 요소를 반환합니다."""
+    # 1. Parse target string if it follows "prop=value" format
+    target_name = _parse_target_name(target).lower()
+    is_class = target.startswith('.')
+    is_id = target.startswith('#')
+    selector = target[1:]
+
+    # 2. Search in elements
+    for el, blob in search_blob:
+        # Check for exact or partial match with the extracted name
+        if target_name in blob:
+            return el
+
+        # Fallback: Check original target string against class/id (legacy support)
+        if is_class and selector in el.get('class', ''):
+            return el
+        if is_id and selector == el.get('id'):
+            return el
+
+    return None
+
+
+def find_action_element(target: Optional[str], elements: List[Element], index: Optional[ElementIndex] = None) -> Optional[Element]:
+    """
+    이전 노드의 요소 목록에서 사용자가 상호작용한 대상 요소를 찾습니다.
+    이름 비교는 대소문자를 구분하지 않습니다.
+
+    항상 목록 순서상 첫 번째로 일치하는 요소를 반환합니다. index가 주어지면
+    id / class 토큰 / 이름 정확 일치 위치를 먼저 조회해, 그 앞쪽만 부분 일치로
+    순차 탐색합니다 (index 없이 전체를 탐색한 결과와 동일).
+
+    Args:
+        target (str): 상호작용 대상 텍스트 또는 식별자 (예: "role=button name=로그인")
+        elements (list): 이전 노드의 인터랙티브 요소 목록
+        index (tuple, optional): _build_element_index로 생성한 인덱스
+
+    Returns:
+        dict: 찾은 요소 정보 또는 None
+    """
+    if not target: return None
+
+    if index is None:
+        return _scan_action_element(target, _build_search_blob(elements))
+
+    by_id, by_class, by_name, search_blob = index
+    # 정확 일치 위치는 확실한 일치이므로, 그보다 앞선 요소만 부분 일치로 확인하면 됨
+    hits = [by_name.get(_parse_target_name(target).lower())]
+    if target.startswith('#'):
+        hits.append(by_id.get(target[1:]))
+    elif target.startswith('.'):
+        hits.append(by_class.get(target[1:]))
+    bound = min((pos for pos in hits if pos is not None), default=None)
+    if bound is None:
+        return _scan_action_element(target, search_blob)
+
+    return _scan_action_element(target, islice(search_blob, bound)) or search_blob[bound][0]
+
+
+# Helper to check if two rects represent the same element (Strict)
+def is_same_element(rect1: Optional[Rect], rect2: Optional[Rect]) -> bool:
+    if not rect1 or not rect2: return False
+    # Allow small margin of error
+    return (abs(rect1['x'] - rect2['x']) < 5 and 
+            abs(rect1['y'] - rect2['y']) < 5 and
+            abs(rect1['width'] - rect2['width']) < 5 and
+            abs(rect1['height'] - rect2['height']) < 5)
+
+
+def _calculate_score(passed: List[Dict[str, str]], failed: List[Dict[str, str]]) -> float:
+    """통과 항목 비율(%)을 계산합니다. 항목이 없으면 100.0."""
+    total = len(passed) + len(failed)
+    return round((len(passed) / total * 100), 1) if total > 0 else 100.0
+
+
+def _center_dist_sq(cx: float, cy: float, rect: Rect) -> float:
+    """(cx, cy)와 rect 중심 사이의 거리 제곱. 한 축이라도 100px 이상 떨어져 있으면 inf."""
+    # 축별 거리가 이미 임계값 이상이면 유클리드 거리도 임계값 이상이므로 조기 제외
+    dx = cx - (rect['x'] + rect['width'] * 0.5)
+    if dx >= 100 or dx <= -100:
+        return math.inf
+    dy = cy - (rect['y'] + rect['height'] * 0.5)
+    if dy >= 100 or dy <= -100:
+        return math.inf
+    return dx * dx + dy * dy
+
+
+def _find_linked_indicator(action_rect: Optional[Rect], action_target: Optional[str], indicators: List[Dict[str, Any]]) -> Tuple[bool, str]:
+    """
+    클릭한 요소와 연관된 진행 표시기가 있는지 확인합니다.
+
+    (1) 컨테이너 위치 일치, (2) 컨테이너 텍스트 일치, (3) 중심 간 거리 100px 미만
+    순서로 각각 전체 표시기를 탐색하며, 먼저 발견된 근거를 반환합니다.
+
+    Returns:
+        tuple: (연관 표시기 발견 여부, 설명 문구)
+    """
+    # 1. Container Match (extracted from DOM hierarchy)
+    if any(is_same_element(action_rect, p['container'].get('rect')) for p in indicators if p.get('container')):
+        return True, "(버튼 내부 로딩-위치 일치) "
+
+    # 2. 텍스트가 일치하는 경우도 고려
+    if action_target and any(action_target in p['container'].get('text', '') for p in indicators if p.get('container')):
+        return True, "(버튼 내부 로딩-텍스트 일치) "
+
+    # 3. Proximity check (Distance-based, threshold 100px heuristic)
+    if action_rect:
+        # Calculate center of button (루프 불변값이므로 한 번만 계산)
+        btn_cx = action_rect['x'] + action_rect['width'] * 0.5
+        btn_cy = action_rect['y'] + action_rect['height'] * 0.5
+        dist_sq = next(
+            (d for d in (_center_dist_sq(btn_cx, btn_cy, p['rect']) for p in indicators if p.get('rect')) if d < 10000),
+            None
+        )
+        if dist_sq is not None:
+            # sqrt는 메시지 출력 시에만 계산
+            return True, f"(버튼과 근접한 로딩 감지: 거리 {int(math.sqrt(dist_sq))}px) "
+
+    return False, ""
+
+
+def _fast_path_result(latency: float) -> Dict[str, Any]:
+    """지연 시간이 1초 미만인 경우의 결과. 진행 표시기 탐색 없이 고정 템플릿을 반환합니다."""
+    if latency < 200:
+        latency_status = "Excellent"
+        latency_desc = "반응이 매우 빠릅니다 (200ms 미만). 즉각적이라고 느껴집니다."
+    else:
+        latency_status = "Good"
+        latency_desc = "반응이 양호합니다 (1초 미만). 사용자의 사고 흐름이 끊기지 않습니다."
+
+    return {
+        "learnability": {"score": 0.0, "passed": [], "failed": []},
+        "efficiency": {
+            "score": 100.0,
+            "passed": [{
+                "check": "System Latency",
+                "message": f"지연 시간({latency}ms)이 1초 미만으로 양호합니다."
+            }],
+            "failed": [],
+            "latency": {"duration_ms": latency, "status": latency_status, "description": latency_desc}
+        },
+        "control": {
+            "score": 100.0,
+            "passed": [{
+                "check": "Visibility of Status",
+                "message": "작업이 신속히 처리되어 즉각적으로 상태가 전환되었습니다."
+            }],
+            "failed": []
+        }
+    }
+
+
+def evaluate_after_action(
+    edge_data: Dict[str, Any],
+    prev_node_data: Dict[str, Any],
+    next_node_data: Dict[str, Any],
+    element_index_cache: Optional[Dict[int, Tuple[List[Element], ElementIndex]]] = None
+) -> Dict[str, Any]:
     """
     시스템 상태 가시성 (Control & Efficiency) 평가 함수.
     
     Args:
         edge_data: 상호작용 데이터 (지연 시간, 액션 타입, 결과 등)
-        prev_node_data: 상호작용 전의 노드 데이터
+        prev_node_data: 상호작용 전의 노드 데이터 (변경하지 않음)
         next_node_data: 상호작용 후의 노드 데이터
+        element_index_cache: 호출자가 소유하는 요소 인덱스 캐시 (id(elements) → (elements, 인덱스)).
+            같은 노드를 여러 엣지에서 평가할 때 전달하면 인덱스를 한 번만 생성합니다.
+            elements 참조를 함께 보관하므로 id가 다른 리스트에 재사용되지 않습니다.
         
     Returns:
         Control 및 Efficiency 평가 결과가 포함된 딕셔너리.
     """
-    results = {
-        "learnability": {"score": 0.0, "passed": [], "failed": []},
-        "efficiency": {
-            "score": 0, 
-            "passed": [], 
-            "failed": [],
-            "latency": {"duration_ms": 0, "status": "Unknown", "description": ""}
-        },
-        "control": {"score": 0, "passed": [], "failed": []}
-    }
+    efficiency_passed: List[Dict[str, str]] = []
+    efficiency_failed: List[Dict[str, str]] = []
+    control_passed: List[Dict[str, str]] = []
+    control_failed: List[Dict[str, str]] = []
 
     # 1. 효율성(Efficiency): 시스템 지연 시간 및 반응성
-    latency = edge_data.get('latency_ms', 0)
-    results["efficiency"]["latency"]["duration_ms"] = latency
+    latency: float = edge_data.get('latency_ms', 0)
+    latency_status: str
+    latency_desc: str
     
-    # Helper to find action element in prev_node_data
-    def find_action_element(target: str, elements: list) -> dict:
-        """
-        이전 노드의 요소 목록에서 사용자가 상호작용한 대상 요소를 찾습니다.
-        
-        Args:
-            target (str): 상호작용 대상 텍스트 또는 식별자 (예: "role=button name=로그인")
-            elements (list): 이전 노드의 인터랙티브 요소 목록
-            
-        Returns:
-            dict: 찾은 요소 정보 또는 None
-        """
-        if not target: return None
-        
-        # 1. Parse target string if it follows "prop=value" format
-        target_name = target
-        if "name=" in target:
-            import re
-            match = re.search(r'name=(.*?)(?:\s|$)', target)
-            if match:
-                target_name = match.group(1).strip()
-        
-        # 2. Search in elements
-        for el in elements:
-            # Prepare accessible name of element
-            el_text = (el.get('text') or "").strip()
-            el_aria = (el.get('aria_label') or "").strip()
-            el_title = (el.get('title') or "").strip()
-            
-            # Check for exact or partial match with the extracted name
-            if target_name in el_text or target_name in el_aria or target_name in el_title:
-                return el
-                
-            # Fallback: Check original target string against class/id (legacy support)
-            if target.startswith('.') and target[1:] in el.get('class', ''):
-                return el
-            if target.startswith('#') and target[1:] == el.get('id'):
-                return el
-                
-        return None
-
-    # Helper to check if two rects represent the same element (Strict)
-    def is_same_element(rect1, rect2):
-        if not rect1 or not rect2: return False
-        # Allow small margin of error
-        return (abs(rect1['x'] - rect2['x']) < 5 and 
-                abs(rect1['y'] - rect2['y']) < 5 and
-                abs(rect1['width'] - rect2['width']) < 5 and
-                abs(rect1['height'] - rect2['height']) < 5)
-
-    # 지연 시간 임계값 기준
-    found_relevant_indicator = False
+    # 지연 시간 임계값 기준: 1초 미만은 진행 표시기 탐색이 필요 없으므로 바로 반환
+    if latency < 1000:
+        return _fast_path_result(latency)
+
+    found_relevant_indicator: bool = False
     
-    if latency < 200:
-        results["efficiency"]["latency"]["status"] = "Excellent"
-        results["efficiency"]["latency"]["description"] = "반응이 매우 빠릅니다 (200ms 미만). 즉각적이라고 느껴집니다."
-    elif latency < 1000:
-        results["efficiency"]["latency"]["status"] = "Good"
-        results["efficiency"]["latency"]["description"] = "반응이 양호합니다 (1초 미만). 사용자의 사고 흐름이 끊기지 않습니다."
-    else:
-        results["efficiency"]["latency"]["status"] = "Slow"
-        desc = f"반응이 느립니다 ({latency}ms). "
-        
-        # 느릴 경우 로딩 UI나 진행 표시가 있었는지 확인
-        status_comps = prev_node_data.get("status_components", {})
-        progress_indicators = status_comps.get("progress_indicators", [])
-        
-        action_target = edge_data.get('action_target') # e.g., text of the clicked element
-        elements = prev_node_data.get('elements', []) # All elements from the previous node
+    latency_status = "Slow"
+    desc = f"반응이 느립니다 ({latency}ms). "
+    
+    # 느릴 경우 로딩 UI나 진행 표시가 있었는지 확인
+    status_comps = prev_node_data.get("status_components") or {}
+    progress_indicators = status_comps.get("progress_indicators") or []
+    
+    action_target = edge_data.get('action_target') # e.g., text of the clicked element
+    elements = prev_node_data.get('elements', []) # All elements from the previous node
+    
+    if progress_indicators:
+        index = None
+        if element_index_cache is not None and elements:
+            cached = element_index_cache.get(id(elements))
+            if cached is not None and cached[0] is elements:
+                index = cached[1]
+            else:
+                index = _build_element_index(elements)
+                element_index_cache[id(elements)] = (elements, index)
+        action_el = find_action_element(action_target, elements, index)
         
-        if progress_indicators:
-            action_el = find_action_element(action_target, elements)
-            
-            if action_el:
-                action_rect = action_el.get('rect')
-                for prog in progress_indicators:
-                    # 1. Container Match (extracted from DOM hierarchy)
-                    container = prog.get('container')
-                    if container:
-                        if is_same_element(action_rect, container.get('rect')):
-                             found_relevant_indicator = True
-                             desc += "(버튼 내부 로딩-위치 일치) "
-                             break
-                        # 텍스트가 일치하는 경우도 고려
-                        if action_target and action_target in container.get('text', ''):
-                             found_relevant_indicator = True
-                             desc += "(버튼 내부 로딩-텍스트 일치) "
-                             break
-                    
-                    
-                    # 3. Proximity check (Distance-based)
-                    # if the indicator is visually close to the button (e.g. < 100px)
-                    prog_rect = prog.get('rect')
-                    if not found_relevant_indicator and action_rect and prog_rect:
-                        # Calculate center of button
-                        btn_cx = action_rect['x'] + action_rect['width'] / 2
-                        btn_cy = action_rect['y'] + action_rect['height'] / 2
-                        
-                        # Calculate center of indicator
-                        prog_cx = prog_rect['x'] + prog_rect['width'] / 2
-                        prog_cy = prog_rect['y'] + prog_rect['height'] / 2
-                        
-                        # Euclidean distance
-                        import math
-                        distance = math.sqrt((btn_cx - prog_cx)**2 + (btn_cy - prog_cy)**2)
-                        
-                        # Threshold: 100px (heuristic)
-                        if distance < 100: # Slightly generous 100px to cover side-by-side layouts
-                             found_relevant_indicator = True
-                             desc += f"(버튼과 근접한 로딩 감지: 거리 {int(distance)}px) "
-                             break
-
-                if found_relevant_indicator:
-                    desc += "이전 화면에서 클릭한 요소와 연관된 진행 표시기가 감지되어, 사용자에게 적절한 피드백을 제공했을 가능성이 높습니다."
-                else:
-                    desc += "진행 표시기가 감지되었으나, 클릭한 버튼(작업 대상)과 거리가 멀어 연관성을 확신할 수 없습니다."
+        if action_el:
+            found_relevant_indicator, reason = _find_linked_indicator(
+                action_el.get('rect'), action_target, progress_indicators
+            )
+            desc += reason
+
+            if found_relevant_indicator:
+                desc += "이전 화면에서 클릭한 요소와 연관된 진행 표시기가 감지되어, 사용자에게 적절한 피드백을 제공했을 가능성이 높습니다."
             else:
-                 # Action target not found in elements list
-                 desc += "진행 표시기가 감지되었으나, 작업 대상 요소의 위치를 파악할 수 없어 연관성을 확신할 수 없습니다."
+                desc += "진행 표시기가 감지되었으나, 클릭한 버튼(작업 대상)과 거리가 멀어 연관성을 확신할 수 없습니다."
         else:
-             desc += "사용자가 기다려야 하는 이유를 알 수 있는 로딩 UI나 진행 상태 표시가 필요합니다."
-        
-        results["efficiency"]["latency"]["description"] = desc
+             # Action target not found in elements list
+             desc += "진행 표시기가 감지되었으나, 작업 대상 요소의 위치를 파악할 수 없어 연관성을 확신할 수 없습니다."
+    else:
+         desc += "사용자가 기다려야 하는 이유를 알 수 있는 로딩 UI나 진행 상태 표시가 필요합니다."
+    
+    latency_desc = desc
 
     # 2. 통제성(Control): 시스템 상태의 가시성 (피드백)
     # 내 행동이 처리되었는지 즉시 알 수 있는가?
@@ -158,41 +297,35 @@ def evaluate_after_action(edge_data: Dict[str, Any], prev_node_data: Dict[str, A
 
 
     # (2) 상태 구분 및 가시성
-    if latency >= 1000:
-        if found_relevant_indicator:
-            results["control"]["passed"].append({
-                "check": "Visibility of Status",
-                "message": "작업 시간이 길었지만, 적절한 진행 표시(로딩 등)가 제공되었습니다."
-            })
-        else:
-            results["control"]["failed"].append({
-                "check": "Visibility of Status",
-                "message": "작업 시간이 길었음에도 '처리 중'임을 나타내는 명확한 지표(로딩 등)를 찾기 어렵습니다."
-            })
-    else:
-        results["control"]["passed"].append({
+    if found_relevant_indicator:
+        control_passed.append({
             "check": "Visibility of Status",
-            "message": "작업이 신속히 처리되어 즉각적으로 상태가 전환되었습니다."
-        })
-
-    # (3) 효율성 (지연 시간)
-    if latency < 1000:
-        results["efficiency"]["passed"].append({
-            "check": "System Latency",
-            "message": f"지연 시간({latency}ms)이 1초 미만으로 양호합니다."
+            "message": "작업 시간이 길었지만, 적절한 진행 표시(로딩 등)가 제공되었습니다."
         })
     else:
-        results["efficiency"]["failed"].append({
-            "check": "System Latency",
-            "message": f"지연 시간({latency}ms)이 1초 이상으로 느립니다."
+        control_failed.append({
+            "check": "Visibility of Status",
+            "message": "작업 시간이 길었음에도 '처리 중'임을 나타내는 명확한 지표(로딩 등)를 찾기 어렵습니다."
         })
 
-    # 점수 계산
-    def calculate_score(cat):
-        total = len(cat["passed"]) + len(cat["failed"])
-        return round((len(cat["passed"]) / total * 100), 1) if total > 0 else 100.0
-
-    results["efficiency"]["score"] = calculate_score(results["efficiency"])
-    results["control"]["score"] = calculate_score(results["control"])
+    # (3) 효율성 (지연 시간)
+    efficiency_failed.append({
+        "check": "System Latency",
+        "message": f"지연 시간({latency}ms)이 1초 이상으로 느립니다."
+    })
 
-    return results
+    # 결과 조립 (점수는 항목별 통과율 기반)
+    return {
+        "learnability": {"score": 0.0, "passed": [], "failed": []},
+        "efficiency": {
+            "score": _calculate_score(efficiency_passed, efficiency_failed),
+            "passed": efficiency_passed,
+            "failed": efficiency_failed,
+            "latency": {"duration_ms": latency, "status": latency_status, "description": latency_desc}
+        },
+        "control": {
+            "score": _calculate_score(control_passed, control_failed),
+            "passed": control_passed,
+            "failed": control_failed
+        }
+    }
@@ -1,10 +1,41 @@
 import json
+import math
 import os
 import re
-
-def parse_color(color_str):
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    # orjson은 표준 json보다 파싱/직렬화가 빠르고 bytes를 바로 다룹니다
+    from orjson import OPT_INDENT_2, dumps as _orjson_dumps, loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+    _orjson_dumps = None
+
+# rgb()/rgba() 문자열에서 숫자 추출
+_RGB_NUM_RE = re.compile(r"\d+(?:\.\d+)?")
+
+# (r, g, b) 0~255
+RGB = Tuple[float, float, float]
+
+# 16진수 색상 코드에 허용되는 문자 (소문자화 이후)
+_HEX_DIGITS = frozenset("0123456789abcdef")
+
+# 자주 쓰이는 색상명
+_NAMED_COLORS: Dict[str, RGB] = {
+    'white': (255, 255, 255),
+    'black': (0, 0, 0),
+    'transparent': (0, 0, 0), # 배경색 투명은 보통 검정 텍스트와 대비 계산 시 영향 없음 (별도 처리 필요하지만 여기선 RGB 값만)
+    'red': (255, 0, 0),
+    'green': (0, 128, 0),
+    'blue': (0, 0, 255)
+}
+
+@lru_cache(maxsize=4096)
+def parse_color(color_str: Optional[str]) -> RGB:
     """
-    CSS 색상 문자열을 파싱하여 [r, g, b] 리스트(0-255)로 반환합니다.
+    CSS 색상 문자열을 파싱하여 (r, g, b) 튜플(0-255)로 반환합니다.
+    같은 색상 문자열이 요소마다 반복되므로 결과를 캐시합니다 (캐시 공유를 위해 불변 튜플 반환).
     
     지원하는 형식:
     1. rgb(r, g, b) 또는 rgba(r, g, b, a)
@@ -15,43 +46,109 @@ def parse_color(color_str):
         color_str (str): 파싱할 CSS 색상 문자열
         
     Returns:
-        list: [r, g, b] 형태의 정수/실수 리스트. 파싱 실패 시 [0, 0, 0] 반환.
+        tuple: (r, g, b) 형태의 정수/실수 튜플. 파싱 실패 시 (0, 0, 0) 반환.
     """
-    if not color_str: return [0, 0, 0]
+    if not color_str: return (0, 0, 0)
+
+    # 0. 브라우저 computed style의 대부분인 "rgb(r, g, b)"는 정규화/분기 없이 바로 파싱
+    if color_str.startswith('rgb(') and color_str.endswith(')'):
+        parts = color_str[4:-1].split(',')
+        if len(parts) == 3:
+            try:
+                rgb = (float(parts[0]), float(parts[1]), float(parts[2]))
+            except ValueError:
+                pass # 아래 일반 경로에서 처리
+            else:
+                # float()는 "nan"/"inf"도 받아들이므로 유한값일 때만 사용
+                if all(map(math.isfinite, rgb)):
+                    return rgb
+
     color_str = color_str.lower().strip()
 
     # 1. Named Colors (자주 쓰이는 색상명 처리)
-    named_colors = {
-        'white': [255, 255, 255],
-        'black': [0, 0, 0],
-        'transparent': [0, 0, 0], # 배경색 투명은 보통 검정 텍스트와 대비 계산 시 영향 없음 (별도 처리 필요하지만 여기선 RGB 값만)
-        'red': [255, 0, 0],
-        'green': [0, 128, 0],
-        'blue': [0, 0, 255]
-    }
-    if color_str in named_colors:
-        return named_colors[color_str]
+    named = _NAMED_COLORS.get(color_str)
+    if named is not None:
+        return named
 
     # 2. Hex Colors (#RRGGBB or #RGB 처리)
     if color_str.startswith('#'):
         hex_code = color_str.lstrip('#')
         # #RGB -> #RRGGBB 변환
         if len(hex_code) == 3:
-            hex_code = ''.join([c*2 for c in hex_code])
-        if len(hex_code) == 6:
+            hex_code = hex_code[0]*2 + hex_code[1]*2 + hex_code[2]*2
+        # int()는 부호/밑줄도 허용하므로 16진수 문자만으로 구성된 경우에만 한 번에 변환
+        if len(hex_code) == 6 and all(c in _HEX_DIGITS for c in hex_code):
+            v = int(hex_code, 16)
+            return ((v >> 16) & 0xff, (v >> 8) & 0xff, v & 0xff)
+
+    # 3. rgb(r, g, b) / rgba(r, g, b, a): 쉼표 구분 형식은 split으로 바로 파싱
+    if color_str.startswith('rgb') and color_str.endswith(')'):
+        parts = color_str[color_str.find('(') + 1:-1].split(',')
+        if len(parts) >= 3:
             try:
-                return [int(hex_code[i:i+2], 16) for i in (0, 2, 4)]
+                rgb = (float(parts[0]), float(parts[1]), float(parts[2])) # Alpha 값은 무시하고 R, G, B만 사용
             except ValueError:
-                pass # 파싱 실패 시 아래 로직으로 이동
+                pass # 공백 구분, % 단위 등은 아래 regex 파싱으로 처리
+            else:
+                if all(map(math.isfinite, rgb)):
+                    return rgb
 
-    # 3. rgb/rgba regex 파싱
-    nums = re.findall(r"(\d+(?:\.\d+)?)", color_str)
+    # 4. 그 외 형식은 regex로 숫자 추출
+    nums = _RGB_NUM_RE.findall(color_str)
     if len(nums) >= 3:
-        return [float(n) for n in nums[:3]] # Alpha 값은 무시하고 R, G, B만 사용
+        return (float(nums[0]), float(nums[1]), float(nums[2]))
     
-    return [0, 0, 0] # 파싱 실패 시 기본값 (검정)
+    return (0, 0, 0) # 파싱 실패 시 기본값 (검정)
+
+def parse_alpha(color_str: str) -> float:
+    """
+    CSS 색상 문자열의 alpha(불투명도) 값을 0.0~1.0으로 반환합니다.
+
+    'transparent', rgba()/hsla()의 네 번째 값, 공백 구문의 "/ a" 값(%, 소수 모두)을 지원하며,
+    alpha가 없거나 파싱할 수 없으면 불투명(1.0)으로 간주합니다.
+    """
+    color_str = color_str.lower().strip()
+    if color_str == 'transparent':
+        return 0.0
+    if not color_str.endswith(')') or '(' not in color_str:
+        return 1.0
 
-def get_luminance(rgb):
+    inner = color_str[color_str.find('(') + 1:-1]
+    if '/' in inner:
+        alpha = inner.rsplit('/', 1)[1]
+    else:
+        parts = inner.split(',')
+        if len(parts) != 4:
+            return 1.0
+        alpha = parts[3]
+
+    alpha = alpha.strip()
+    try:
+        if alpha.endswith('%'):
+            return float(alpha[:-1]) / 100.0
+        return float(alpha)
+    except ValueError:
+        return 1.0
+
+def _linearize_channel(c: float) -> float:
+    """sRGB 채널 값(0~255)을 선형화된 값으로 변환합니다."""
+    c /= 255.0
+    if c <= 0.03928:
+        return c / 12.92
+    return ((c + 0.055) / 1.055) ** 2.4
+
+# 정수 채널 값(0~255)에 대한 선형화 결과 테이블 (모듈 로드 시 한 번만 계산)
+_SRGB_LIN: Tuple[float, ...] = tuple(_linearize_channel(c) for c in range(256))
+
+def _linear(c: float) -> float:
+    """정수 채널 값은 테이블에서 조회하고, 그 외(소수, 범위 밖)는 직접 계산합니다."""
+    i = int(c)
+    if i == c and 0 <= i <= 255:
+        return _SRGB_LIN[i]
+    return _linearize_channel(c)
+
+@lru_cache(maxsize=1024)
+def get_luminance(rgb: RGB) -> float:
     """
     WCAG 2.1 정의에 따른 상대적 휘도(Relative Luminance)를 계산합니다.
     
@@ -59,41 +156,64 @@ def get_luminance(rgb):
     L = 0.2126 * R + 0.7152 * G + 0.0722 * B
     (각 RGB 값은 sRGB 공간에서 선형화된 값으로 변환 후 계산)
     
+    정수 채널 값은 미리 계산한 테이블(_SRGB_LIN)을 사용하며, 페이지 내 색상 종류가
+    적으므로 결과를 캐시합니다.
+    
     Args:
-        rgb (list): [r, g, b] (0~255 범위)
+        rgb (tuple): (r, g, b) (0~255 범위)
         
     Returns:
         float: 0.0 (가장 어두움) ~ 1.0 (가장 밝음)
     """
-    colors = []
-    for c in rgb:
-        c /= 255.0
-        if c <= 0.03928:
-            colors.append(c / 12.92)
-        else:
-            colors.append(((c + 0.055) / 1.055) ** 2.4)
-    return 0.2126 * colors[0] + 0.7152 * colors[1] + 0.0722 * colors[2]
+    r, g, b = rgb
+    return 0.2126 * _linear(r) + 0.7152 * _linear(g) + 0.0722 * _linear(b)
 
-def get_contrast_ratio(rgb1, rgb2):
+@lru_cache(maxsize=8192)
+def get_contrast_ratio(rgb1: RGB, rgb2: RGB) -> float:
     """
     두 색상 간의 명암비(Contrast Ratio)를 계산합니다.
     WCAG 접근성 기준 검사에 핵심적으로 사용됩니다.
+    표기만 다른 같은 색상 쌍(예: "#fff"와 "white")도 재사용되도록 RGB 쌍 단위로 캐시합니다.
     
     공식: (L1 + 0.05) / (L2 + 0.05) (L1이 더 밝은 색의 휘도)
     
     Args:
-        rgb1, rgb2 (list): [r, g, b] 색상 값
+        rgb1, rgb2 (tuple): (r, g, b) 색상 값
         
     Returns:
         float: 1.0 ~ 21.0 사이의 명암비
     """
+    if rgb1 == rgb2: # 같은 색상 (예: 부모 배경을 그대로 상속)
+        return 1.0
     l1 = get_luminance(rgb1)
     l2 = get_luminance(rgb2)
-    brightest = max(l1, l2)
-    darkest = min(l1, l2)
-    return (brightest + 0.05) / (darkest + 0.05)
+    if l1 >= l2:
+        return (l1 + 0.05) / (l2 + 0.05)
+    return (l2 + 0.05) / (l1 + 0.05)
+
+@lru_cache(maxsize=4096)
+def _color_metrics(bg_raw: str, fg_raw: Optional[str], parent_bg_raw: Optional[str]) -> Tuple[bool, float, Optional[float]]:
+    """
+    요소의 배경/글자/부모 배경 스타일 문자열 조합에 대한 명암비 계산 결과를 반환합니다.
+    같은 조합(예: 같은 nav 안의 링크들)이 반복되므로 조합 단위로 캐시합니다.
+
+    Returns:
+        tuple: (배경 투명 여부, 텍스트 명암비, 배경 대비 명암비 - 투명 배경이면 None)
+    """
+    btn_bg = parse_color(bg_raw)
+    btn_text = parse_color(fg_raw)
+    parent_bg = parse_color(parent_bg_raw)
+
+    # 배경이 투명한 경우 부모 배경색 사용 (미지정 배경도 투명으로 간주)
+    is_transparent = not bg_raw or parse_alpha(bg_raw) == 0.0
+    if is_transparent:
+        return True, get_contrast_ratio(parent_bg, btn_text), None
+    return False, get_contrast_ratio(btn_bg, btn_text), get_contrast_ratio(btn_bg, parent_bg)
+
+# 단위별 px 환산 계수 ("rem"이 "em"보다 먼저 검사되어야 함)
+_UNIT_FACTORS = (("px", 1.0), ("rem", 16.0), ("em", 16.0))
 
-def parse_css_size(value_str):
+def parse_css_size(value_str: Any) -> float:
     """
     CSS 크기 문자열(예: 10px, 1.5rem)을 파싱하여 픽셀(px) 단위 float로 변환합니다.
     
@@ -103,41 +223,63 @@ def parse_css_size(value_str):
     - 기타 단위(%, vh 등) 또는 파싱 불가: 0.0 반환 (크기 비교에서 제외하기 위함)
     
     Args:
-        value_str (str): CSS 크기 문자열
+        value_str (str): CSS 크기 문자열 (문자열이 아니면 0.0)
         
     Returns:
         float: 픽셀 단위 크기 또는 0.0
     """
+    # 캐시 키로 해시할 수 없는 값(list, dict 등)이 들어올 수 있으므로 캐시 밖에서 거름
     if not value_str or not isinstance(value_str, str):
         return 0.0
-    
+    return _parse_css_size_str(value_str)
+
+@lru_cache(maxsize=4096)
+def _parse_css_size_str(value_str: str) -> float:
+    """parse_css_size의 문자열 파싱부. 같은 크기 문자열이 반복되므로 결과를 캐시합니다."""
     value_str = value_str.lower().strip()
     if not value_str:
         return 0.0
 
-    # 1. px 단위 처리
-    if value_str.endswith("px"):
-        try:
-            return float(value_str.replace("px", ""))
-        except ValueError:
-            return 0.0
-            
-    # 2. rem / em 단위 처리 (Root font size 16px 기준)
-    if value_str.endswith("rem") or value_str.endswith("em"):
-        try:
-            val = float(value_str.replace("rem", "").replace("em", ""))
-            return val * 16.0
-        except ValueError:
-            return 0.0
-            
-    # 3. 단위 없는 숫자 (드물지만 처리)
-    if re.match(r"^\d+(\.\d+)?$", value_str):
-        try:
-            return float(value_str)
-        except ValueError:
-            return 0.0
+    # 1. px / rem / em 단위 처리 (Root font size 16px 기준)
+    for unit, factor in _UNIT_FACTORS:
+        if value_str.endswith(unit):
+            try:
+                return float(value_str[:-len(unit)]) * factor
+            except ValueError:
+                return 0.0
 
-    return 0.0
+    # 2. 단위 없는 숫자 (드물지만 처리, "nan"/"inf" 같은 키워드는 제외)
+    try:
+        size = float(value_str)
+    except ValueError:
+        return 0.0
+    return size if math.isfinite(size) else 0.0
+
+# 체크 항목 이름
+_CHK_STD_TAG = "표준 태그 사용"
+_CHK_CUSTOM_BTN = "커스텀 버튼 접근성 속성"
+_CHK_LABEL = "레이블(텍스트) 제공"
+_CHK_DISABLED_STATE = "비활성화 상태 시각적 구분"
+_CHK_CURSOR = "마우스 커서 스타일"
+_CHK_TARGET_SIZE = "터치 타겟 크기"
+_CHK_TEXT_CONTRAST = "텍스트 명암비(가독성)"
+_CHK_BG_CONTRAST = "배경 대비 가시성"
+_CHK_HEADING = "페이지 제목(Heading)"
+_CHK_CURRENT = "현재 위치 표시"
+_CHK_SELECTED = "선택/상태 표시"
+_CHK_BREADCRUMB = "이동 경로(Breadcrumb)"
+
+# 요소 단위 체크(A. 학습 용이성, 헤딩)가 적용되는 요소 타입
+_CHECKED_TYPES = frozenset(("button", "button_custom", "link", "heading"))
+
+def _parse_opacity(value: Optional[str]) -> float:
+    """CSS opacity 문자열을 float로 변환합니다. 미지정이거나 대부분의 경우인 "1"은 파싱 없이 1.0."""
+    if not value or value == "1":
+        return 1.0
+    return float(value)
+
+# 활성/비활성 스타일 차이를 비교할 속성
+_DISABLED_DIFF_PROPS = ("backgroundColor", "opacity", "color", "border")
 
 def check_accessibility(json_path=None, data=None):
     """
@@ -162,14 +304,14 @@ def check_accessibility(json_path=None, data=None):
             print(f"Error: {json_path} not found.")
             return None
 
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(json_path, 'rb') as f:
+            data = _json_loads(f.read())
 
     elements = data.get('elements', [])
     url = data.get('url', 'Unknown URL')
     
-    print(f"--- Accessibility & Usability Checklist Result for {url} ---")
-    print(f"Total elements analyzed: {len(elements)}\n")
+    print(f"--- Accessibility & Usability Checklist Result for {url} ---\n"
+          f"Total elements analyzed: {len(elements)}\n")
 
     # 결과 저장을 위한 구조 표준화
     json_results = {
@@ -186,14 +328,27 @@ def check_accessibility(json_path=None, data=None):
     
     has_breadcrumb = False
 
+    learn_items = json_results["learnability"]["items"]
+    ctrl_items = json_results["control"]["items"]
+
     for el in elements:
         tag = el.get('tag', 'unknown')
         el_type = el.get('type')
+        aria_current = el.get('aria_current')
+        is_current = aria_current and aria_current != 'false'
+        is_selected = el.get('aria_selected') == 'true' or el.get('checked') is True or el.get('aria_pressed') == 'true'
+
+        # 적용되는 체크가 하나도 없는 요소(일반 span, p, img 등)는 건너뜀
+        # (체크 대상 타입, Breadcrumb용 nav, 현재 위치/선택 상태 표시. 크기 0인 요소도 타입이 맞으면 유지)
+        if not (el_type in _CHECKED_TYPES or tag == 'nav' or is_current or is_selected):
+            continue
+
         role = el.get('role')
         tabindex = el.get('tabindex')
         aria_label = (el.get('aria_label') or "").lower()
         title = (el.get('title') or "").lower()
-        text = el.get('text', '').strip() or el.get('placeholder', '') or 'No Text'
+        actual_text = el.get('text', '').strip()
+        text = actual_text or el.get('placeholder', '') or 'No Text'
         styles = el.get('styles', {})
         disabled_styles = el.get('disabled_styles')
         rect = el.get('rect', {})
@@ -220,7 +375,7 @@ def check_accessibility(json_path=None, data=None):
         
         # [표준 태그 사용 여부]
         if el_type in ["button", "button_custom", "link"]:
-            check_name = "표준 태그 사용"
+            check_name = _CHK_STD_TAG
             if el_type == "button" and tag not in ["button", "input"]:
                 checks_learn.append({"name": check_name, "status": "FAIL", "message": f"버튼 용도로 비표준 태그 <{tag}> 사용됨"})
                 status_learn = "FAIL"
@@ -232,7 +387,7 @@ def check_accessibility(json_path=None, data=None):
 
             # [커스텀 버튼 속성 검사]
             if tag in ["div", "span"]:
-                check_name = "커스텀 버튼 접근성 속성"
+                check_name = _CHK_CUSTOM_BTN
                 issues = []
                 if role != "button": issues.append("role='button' 누락")
                 if not tabindex or tabindex == "-1": issues.append("tabindex 누락 또는 잘못됨")
@@ -245,8 +400,7 @@ def check_accessibility(json_path=None, data=None):
 
         # [텍스트/레이블 존재 여부]
         if el_type in ["button", "button_custom"]:
-            check_name = "레이블(텍스트) 제공"
-            actual_text = el.get('text', '').strip()
+            check_name = _CHK_LABEL
             if not actual_text and not aria_label and not title:
                 checks_learn.append({"name": check_name, "status": "FAIL", "message": "텍스트나 대체 텍스트(aria-label 등)가 없음"})
                 status_learn = "FAIL"
@@ -255,31 +409,25 @@ def check_accessibility(json_path=None, data=None):
 
         # [시각적 규칙 검사]
         if el_type in ["button", "button_custom", "link"]:
+            cursor = styles.get("cursor")
             is_disabled = el.get('disabled', False)
-            
+
             # [비활성화 상태 시각적 구분]
             if disabled_styles and el_type != "input":
-                check_name = "비활성화 상태 시각적 구분"
-                diff_found = False
-                for prop in ["backgroundColor", "opacity", "color", "border"]:
-                    if styles.get(prop) != disabled_styles.get(prop):
-                        diff_found = True
-                        break
-                
+                check_name = _CHK_DISABLED_STATE
                 if is_disabled:
-                    if styles.get('cursor') != 'not-allowed' and float(styles.get('opacity', '1') or '1') >= 1:
+                    if cursor != 'not-allowed' and _parse_opacity(styles.get('opacity')) >= 1:
                         checks_learn.append({"name": check_name, "status": "FAIL", "message": "비활성화 상태임에도 시각적 구분(커서/투명도 등)이 부족함"})
                         status_learn = "FAIL"
                     else:
                         checks_learn.append({"name": check_name, "status": "PASS", "message": "비활성화 상태가 시각적으로 명확함"})
-                elif not diff_found:
+                elif not any(styles.get(prop) != disabled_styles.get(prop) for prop in _DISABLED_DIFF_PROPS):
                      checks_learn.append({"name": check_name, "status": "INFO", "message": "비활성 스타일이 별도로 감지되지 않음"})
                 else:
                      checks_learn.append({"name": check_name, "status": "PASS", "message": "비활성 스타일 정의됨"})
 
             # [Cursor Check]
-            check_name = "마우스 커서 스타일"
-            cursor = styles.get("cursor")
+            check_name = _CHK_CURSOR
             if is_disabled:
                 if cursor == "pointer":
                     checks_learn.append({"name": check_name, "status": "FAIL", "message": "비활성 요소에 'pointer' 커서가 사용됨"})
@@ -297,7 +445,7 @@ def check_accessibility(json_path=None, data=None):
                     checks_learn.append({"name": check_name, "status": "PASS", "message": "커서 스타일 적절함"})
 
             # [Size Check]
-            check_name = "터치 타겟 크기"
+            check_name = _CHK_TARGET_SIZE
             width = rect.get('width', 0) if rect else 0
             height = rect.get('height', 0) if rect else 0
             if width <= 0 or height <= 0:
@@ -311,28 +459,11 @@ def check_accessibility(json_path=None, data=None):
                 checks_learn.append({"name": check_name, "status": "PASS", "message": f"크기 적절함 ({int(width)}x{int(height)}px)"})
 
             # [Color Contrast]
-            check_name = "텍스트 명암비(가독성)"
-            btn_bg = parse_color(styles.get("backgroundColor"))
-            btn_text = parse_color(styles.get("color"))
-            
-            # 배경이 투명한 경우 부모 배경색 사용
-            # bg_for_contrast = btn_bg
-            # check_msg_suffix = ""
-            
-            # 투명 여부 확인 (alpha channel or 'transparent' keyword handled by parse_color returning [0,0,0] usually, 
-            # but we need to check the raw style string or if parse_color handles alpha)
-            # parse_color stub implementation currently returns [r,g,b], ignoring alpha unless we improve it.
-            # safe check: check style string
-            bg_style = styles.get("backgroundColor", "").lower()
-            is_transparent = bg_style == 'transparent' or 'rgba(0, 0, 0, 0)' in bg_style
-            if is_transparent:
-                bg_for_contrast = parse_color(el.get("parent_backgroundColor"))
-                check_msg_suffix = " (투명 배경, 부모 배경색 기준)"
-            else:
-                bg_for_contrast = btn_bg
-                check_msg_suffix = ""
-
-            contrast_text = get_contrast_ratio(bg_for_contrast, btn_text)
+            check_name = _CHK_TEXT_CONTRAST
+            is_transparent, contrast_text, contrast_container = _color_metrics(
+                styles.get("backgroundColor") or "", styles.get("color"), el.get("parent_backgroundColor")
+            )
+            check_msg_suffix = " (투명 배경, 부모 배경색 기준)" if is_transparent else ""
             
             if contrast_text < 4.5:
                 checks_learn.append({"name": check_name, "status": "FAIL", "message": f"대비가 낮음: {contrast_text:.2f}:1 (최소 4.5:1 권장){check_msg_suffix}"})
@@ -341,10 +472,8 @@ def check_accessibility(json_path=None, data=None):
                 checks_learn.append({"name": check_name, "status": "PASS", "message": f"대비 적절함 ({contrast_text:.2f}:1){check_msg_suffix}"})
 
             # [Visibility against Background]
-            check_name = "배경 대비 가시성"
-            parent_bg = parse_color(el.get("parent_backgroundColor"))
-            if styles.get("backgroundColor") != "rgba(0, 0, 0, 0)" and "transparent" not in styles.get("backgroundColor", ""):
-                contrast_container = get_contrast_ratio(btn_bg, parent_bg)
+            check_name = _CHK_BG_CONTRAST
+            if contrast_container is not None:
                 if contrast_container < 3.0:
                     checks_learn.append({"name": check_name, "status": "FAIL", "message": f"배경과 구분이 잘 안됨: {contrast_container:.2f}:1 (최소 3.0:1 권장)"})
                     status_learn = "FAIL"
@@ -357,7 +486,7 @@ def check_accessibility(json_path=None, data=None):
 
         # [페이지 제목 (Heading) 확인]
         if el_type == 'heading':
-            check_name = "페이지 제목(Heading)"
+            check_name = _CHK_HEADING
             if not text:
                 checks_ctrl.append({"name": check_name, "status": "FAIL", "message": f"헤딩 태그 <{tag}> 내용이 비어있음"})
                 status_ctrl = "FAIL"
@@ -365,55 +494,53 @@ def check_accessibility(json_path=None, data=None):
                 checks_ctrl.append({"name": check_name, "status": "PASS", "message": f"헤딩 존재함: '{text}'"})
 
         # [현재 위치 표시 (Current Page Indicator)]
-        aria_current = el.get('aria_current')
-        if aria_current and aria_current != 'false':
-            check_name = "현재 위치 표시"
+        if is_current:
+            check_name = _CHK_CURRENT
             checks_ctrl.append({"name": check_name, "status": "PASS", "message": f"현재 페이지임을 명시함 (aria-current='{aria_current}')"})
             
         # [선택 상태 표시 (Selection State)]
-        is_selected = el.get('aria_selected') == 'true' or el.get('checked') is True or el.get('aria_pressed') == 'true'
         if is_selected:
-            check_name = "선택/상태 표시"
+            check_name = _CHK_SELECTED
             checks_ctrl.append({"name": check_name, "status": "PASS", "message": "요소가 선택/체크된 상태임"})
             # 통제 관련 요소가 하나라도 있으면 PASS로 칠 수도 있지만, 여기서는 개별 체크 결과를 저장
         
         # [Breadcrumb Check]
         if tag == 'nav' and (aria_label == 'breadcrumb' or 'breadcrumb' in (el.get('class') or '').lower()):
             has_breadcrumb = True
-            checks_ctrl.append({"name": "이동 경로(Breadcrumb)", "status": "PASS", "message": "Breadcrumb 제공됨"})
+            checks_ctrl.append({"name": _CHK_BREADCRUMB, "status": "PASS", "message": "Breadcrumb 제공됨"})
         
         # ---------------------------------------------------------
         # 결과 집계 (Standardized format: Grouped by element)
         # ---------------------------------------------------------
         if checks_learn:
-            json_results["learnability"]["items"].append({
+            learn_items.append({
                 "element": element_info,
                 "checks": checks_learn
             })
-            for c in checks_learn:
-                if c["status"] == "FAIL": learn_stats["failed"] += 1
-                else: learn_stats["passed"] += 1
+            failed_count = sum(c["status"] == "FAIL" for c in checks_learn)
+            learn_stats["failed"] += failed_count
+            learn_stats["passed"] += len(checks_learn) - failed_count
 
         if checks_ctrl:
-            json_results["control"]["items"].append({
+            ctrl_items.append({
                 "element": element_info,
                 "checks": checks_ctrl
             })
-            for c in checks_ctrl:
-                if c["status"] == "FAIL": ctrl_stats["failed"] += 1
-                else: ctrl_stats["passed"] += 1
+            failed_count = sum(c["status"] == "FAIL" for c in checks_ctrl)
+            ctrl_stats["failed"] += failed_count
+            ctrl_stats["passed"] += len(checks_ctrl) - failed_count
 
     # [Global Checks]
     if not has_breadcrumb:
-        json_results["control"]["items"].append({
+        ctrl_items.append({
             "element": {"tag": "Page", "text": "Global Check", "type": "page"},
-            "checks": [{"name": "이동 경로(Breadcrumb)", "status": "FAIL", "message": "Breadcrumb(이동 경로)가 제공되지 않음"}]
+            "checks": [{"name": _CHK_BREADCRUMB, "status": "FAIL", "message": "Breadcrumb(이동 경로)가 제공되지 않음"}]
         })
         ctrl_stats["failed"] += 1
     else:
-        json_results["control"]["items"].append({
+        ctrl_items.append({
             "element": {"tag": "Page", "text": "Global Check", "type": "page"},
-            "checks": [{"name": "이동 경로(Breadcrumb)", "status": "PASS", "message": "Breadcrumb 제공됨"}]
+            "checks": [{"name": _CHK_BREADCRUMB, "status": "PASS", "message": "Breadcrumb 제공됨"}]
         })
         ctrl_stats["passed"] += 1
 
@@ -430,15 +557,19 @@ def check_accessibility(json_path=None, data=None):
     # ---------------------------------------------------------
     # 터미널 출력 (간단 요약)
     # ---------------------------------------------------------
-    print(f"\n[Summary]")
-    print(f"Learnability - 통과: {learn_stats['passed']}, 실패: {learn_stats['failed']} (Score: {json_results['learnability']['score']})")
-    print(f"Control      - 통과: {ctrl_stats['passed']}, 실패: {ctrl_stats['failed']} (Score: {json_results['control']['score']})")
+    print(f"\n[Summary]\n"
+          f"Learnability - 통과: {learn_stats['passed']}, 실패: {learn_stats['failed']} (Score: {json_results['learnability']['score']})\n"
+          f"Control      - 통과: {ctrl_stats['passed']}, 실패: {ctrl_stats['failed']} (Score: {json_results['control']['score']})")
 
     # JSON 파일 저장
     if json_path:
         output_path = os.path.join(os.path.dirname(json_path), "checklist_results.json")
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(json_results, f, indent=2, ensure_ascii=False)
+        if _orjson_dumps is not None:
+            with open(output_path, "wb") as f:
+                f.write(_orjson_dumps(json_results, option=OPT_INDENT_2))
+        else:
+            with open(output_path, "w", encoding="utf-8") as f:
+                json.dump(json_results, f, indent=2, ensure_ascii=False)
         print(f"\n--- 결과가 저장되었습니다: {output_path} ---")
 
     return json_results
@@ -1,5 +1,9 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import math
+import re
+
+# "role=button name=로그인" 형식의 target에서 name 값 추출
+_NAME_RE = re.compile(r'name=(.*?)(?:\s|$)')
 
 def evaluate_doing_actions(chain_data: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
@@ -40,10 +44,18 @@ def evaluate_doing_actions(chain_data: List[Dict[str, Any]]) -> Dict[str, Any]:
     }
 
     # 더 나은 휴리스틱: 0단계의 경우 거리를 무시하거나 화면 중앙(1920/2, 1080/2)을 가정.
-    last_pos = {"x": 960, "y": 540} 
+    last_x, last_y = 960, 540
 
     total_klm_time = 0.0
 
+    # 단계별 결과를 누적할 리스트 (루프 안에서 중첩 조회 반복 방지)
+    klm_breakdown = results["efficiency"]["interaction_efficiency"]["klm_breakdown"]
+    size_issues = results["efficiency"]["target_size_spacing"]["size_issues"]
+    fitts_issues = results["efficiency"]["target_size_spacing"]["fitts_issues"]
+
+    # 같은 노드의 요소 목록이 여러 단계에서 반복되므로 노드(요소 목록)별로 검색용 목록 재사용
+    text_lookups: Dict[int, List[Tuple[str, str, Dict]]] = {}
+
     for i, step in enumerate(chain_data):
         action = step.get('action', {})
         from_node = step.get('from_node', {}) or {}
@@ -65,8 +77,11 @@ def evaluate_doing_actions(chain_data: List[Dict[str, Any]]) -> Dict[str, Any]:
             
         elif action_type == "fill" or action_type == "type":
             # M (정신적 준비) + P (입력창 포인팅) + B (클릭) + H (키보드로 손 이동) + K * 길이
+            # 키 입력은 글자 수만큼 나열하지 않고 "K*길이" 한 항목으로 기록
             text_len = len(str(action_value)) if action_value else 0
-            step_ops = ["M", "P", "B", "H"] + ["K"] * text_len
+            step_ops = ["M", "P", "B", "H"]
+            if text_len:
+                step_ops.append(f"K*{text_len}")
             step_time = KLM_OPS["M"] + KLM_OPS["P"] + KLM_OPS["B"] + KLM_OPS["H"] + (KLM_OPS["K"] * text_len)
             
         elif action_type == "hover":
@@ -85,7 +100,7 @@ def evaluate_doing_actions(chain_data: List[Dict[str, Any]]) -> Dict[str, Any]:
             step_time = KLM_OPS["M"]
 
         total_klm_time += step_time
-        results["efficiency"]["interaction_efficiency"]["klm_breakdown"].append({
+        klm_breakdown.append({
             "step": i,
             "action": action_type,
             "ops": step_ops,
@@ -93,28 +108,35 @@ def evaluate_doing_actions(chain_data: List[Dict[str, Any]]) -> Dict[str, Any]:
         })
 
         # --- 2. 목표 크기 및 간격 (Fitts의 법칙) ---
-        target_el = find_element(action_target, elements)
+        lookup = None
+        if action_target and elements:
+            lookup = text_lookups.get(id(elements))
+            if lookup is None:
+                lookup = text_lookups[id(elements)] = _build_text_lookup(elements)
+        target_el = find_element(action_target, elements, lookup)
         
         if target_el and target_el.get('rect'):
             rect = target_el['rect']
-            cx = rect['x'] + rect['width'] / 2
-            cy = rect['y'] + rect['height'] / 2
+            rect_w = rect['width']
+            rect_h = rect['height']
+            cx = rect['x'] + rect_w / 2
+            cy = rect['y'] + rect_h / 2
             
             # (A) 크기 확인
             # Apple HIG: 44x44pt, Android: 48x48dp, WCAG: 24x24 (최소)
             # 엄격한 평가자를 위해 엄격하게 기준 설정: 32px 미만이면 경고
-            min_dim = min(rect['width'], rect['height'])
+            min_dim = rect_w if rect_w <= rect_h else rect_h
             if min_dim < 32:
-                results["efficiency"]["target_size_spacing"]["size_issues"].append({
+                size_issues.append({
                     "step": i,
                     "target": action_target,
-                    "size": f"{rect['width']}x{rect['height']}",
+                    "size": f"{rect_w}x{rect_h}",
                     "message": "목표가 너무 작아(<32px) 정확하게 클릭하기 어렵습니다."
                 })
             
             # (B) Fitts의 법칙
             # 마지막 위치로부터의 거리
-            dist = math.sqrt((cx - last_pos['x'])**2 + (cy - last_pos['y'])**2)
+            dist = math.hypot(cx - last_x, cy - last_y)
             
             # Fitts의 법칙에서 너비(W)는 일반적으로 이동 축을 따른 목표의 크기입니다.
             # 유효 너비에 대한 보수적인 추정치로 min_dim을 사용합니다.
@@ -124,7 +146,7 @@ def evaluate_doing_actions(chain_data: List[Dict[str, Any]]) -> Dict[str, Any]:
             fitts_id = math.log2(dist / w + 1)
             
             if fitts_id > 3.0: # "어려움"에 대한 휴리스틱 임계값
-                results["efficiency"]["target_size_spacing"]["fitts_issues"].append({
+                fitts_issues.append({
                     "step": i,
                     "target": action_target,
                     "distance": round(dist, 1),
@@ -134,17 +156,16 @@ def evaluate_doing_actions(chain_data: List[Dict[str, Any]]) -> Dict[str, Any]:
                 })
             
             # 마지막 위치 업데이트
-            last_pos = {"x": cx, "y": cy}
+            last_x, last_y = cx, cy
         else:
             # 탐색했거나 목표를 찾을 수 없는 경우, 현재 위치는 정의되지 않습니다.
-            # last_pos를 유지할지 초기화할지? last_pos를 유지하는 것은 위험합니다.
+            # 마지막 위치를 유지할지 초기화할지? 마지막 위치를 유지하는 것은 위험합니다.
             # 어디를 클릭했는지 모르면 다음 단계를 위한 거리(D)를 계산할 수 없습니다.
             pass
 
     results["efficiency"]["interaction_efficiency"]["total_estimated_time_s"] = round(total_klm_time, 2)
 
     # 3. Fitts & Size 평가 반영
-    size_issues = results["efficiency"]["target_size_spacing"]["size_issues"]
     if size_issues:
         results["efficiency"]["failed"].append({
             "check": "Target Size Compliance",
@@ -156,7 +177,6 @@ def evaluate_doing_actions(chain_data: List[Dict[str, Any]]) -> Dict[str, Any]:
             "message": "모든 상호작용 요소가 적절한 크기를 가집니다."
         })
 
-    fitts_issues = results["efficiency"]["target_size_spacing"]["fitts_issues"]
     if fitts_issues:
         results["efficiency"]["failed"].append({
             "check": "Fitts's Law Optimization",
@@ -194,20 +214,24 @@ def evaluate_doing_actions(chain_data: List[Dict[str, Any]]) -> Dict[str, Any]:
 
 
 
-def find_element(target: str, elements: List[Dict]) -> Optional[Dict]:
-    """after_actions에 있는 것과 유사한 헬퍼 함수입니다."""
+def _build_text_lookup(elements: List[Dict]) -> List[Tuple[str, str, Dict]]:
+    """요소별 (text, aria_label, element) 목록을 한 번만 만들어 둡니다."""
+    return [(el.get('text') or "", el.get('aria_label') or "", el) for el in elements]
+
+def find_element(target: str, elements: List[Dict], lookup: Optional[List[Tuple[str, str, Dict]]] = None) -> Optional[Dict]:
+    """after_actions에 있는 것과 유사한 헬퍼 함수입니다. lookup이 주어지면 재사용합니다."""
     if not target: return None
     
     # 간단한 휴리스틱 검색
     target_clean = target
     if "name=" in target:
-        import re
-        match = re.search(r'name=(.*?)(?:\s|$)', target)
+        match = _NAME_RE.search(target)
         if match: target_clean = match.group(1)
+
+    if lookup is None:
+        lookup = _build_text_lookup(elements)
         
-    for el in elements:
-        txt = (el.get('text') or "")
-        aria = (el.get('aria_label') or "")
+    for txt, aria, el in lookup:
         if target_clean in txt or target_clean in aria:
             return el
             
@@ -216,16 +240,16 @@ def find_element(target: str, elements: List[Dict]) -> Optional[Dict]:
 def print_efficiency_report(results: Dict):
     eff = results["efficiency"]
     
-    print("\n" + "="*40)
-    print("      [효율성 분석 보고서]      ")
-    print("="*40)
-    print(f" Efficiency Score: {eff['score']}/100")
-    
-    print("\n[통과 포인트]")
-    for p in eff["passed"]:
-        print(f"  v {p['check']}: {p['message']}")
-        
-    print("\n[개선 필요 포인트]")
-    for f in eff["failed"]:
-        print(f"  ! {f['check']}: {f['message']}")
-    print("="*40 + "\n")
+    # 보고서 전체를 한 번에 출력
+    lines = [
+        "\n" + "="*40,
+        "      [효율성 분석 보고서]      ",
+        "="*40,
+        f" Efficiency Score: {eff['score']}/100",
+        "\n[통과 포인트]",
+    ]
+    lines.extend(f"  v {p['check']}: {p['message']}" for p in eff["passed"])
+    lines.append("\n[개선 필요 포인트]")
+    lines.extend(f"  ! {f['check']}: {f['message']}" for f in eff["failed"])
+    lines.append("="*40 + "\n")
+    print("\n".join(lines))
@@ -27,10 +27,7 @@ class BaseAppException(Exception):
     
     def to_dict(self) -> Dict[str, Any]:
         """예외를 딕셔너리로 변환 (API 응답용)"""
-        result = {
-            "error": self.__class__.__name__,
-            "message": self.message
-        }
+        result: Dict[str, Any] = {"error": type(self).__name__, "message": self.message}
         if self.details:
             result["details"] = self.details
         if self.original_error:
@@ -1,5 +1,6 @@
 """run_id / from_node_id용 context 변수. 에이전트·run_memory 툴에서 런·노드 컨텍스트 전달."""
-from contextvars import ContextVar
+from contextvars import ContextVar, Token
+from typing import Dict
 from uuid import UUID
 
 # run_id를 저장할 context variable
@@ -22,4 +23,19 @@ def set_from_node_id(from_node_id: UUID) -> None:
 
 def get_from_node_id() -> UUID | None:
     """현재 context에서 from_node_id 조회"""
-    return from_node_id_context.get()
\ No newline at end of file
+    return from_node_id_context.get()
+
+# run_memory 툴의 조회 캐시 (run_agent 호출 한 번 동안만 설정됨)
+run_memory_cache_context: ContextVar[Dict[UUID, dict] | None] = ContextVar("run_memory_cache", default=None)
+
+def begin_run_memory_cache() -> Token:
+    """현재 context에 빈 run_memory 캐시를 설정하고, 해제용 토큰을 반환"""
+    return run_memory_cache_context.set({})
+
+def end_run_memory_cache(token: Token) -> None:
+    """begin_run_memory_cache()로 설정한 캐시를 해제"""
+    run_memory_cache_context.reset(token)
+
+def get_run_memory_cache() -> Dict[UUID, dict] | None:
+    """현재 context의 run_memory 캐시 조회 (run_agent 밖에서는 None)"""
+    return run_memory_cache_context.get()
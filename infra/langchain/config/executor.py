@@ -1,8 +1,10 @@
 import asyncio
-import time
 from typing import Any
 from langchain_core.runnables import Runnable
 from langchain_core.exceptions import OutputParserException
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
 
 MAX_RETRIES = 3
 DELAY = 1  # 재시도 간 대기 시간 (초)
@@ -30,15 +32,13 @@ async def ainvoke_runnable(
     Raises:
         RuntimeError: 실행 실패 시
     """
-    last_error = None
-    start = time.time()
-
     merged_config = {"timeout": 30, **(config or {})}
+    invoke = runnable.ainvoke
+    last_exc: Exception | None = None
 
     for attempt in range(MAX_RETRIES):
         try:
-            response = await runnable.ainvoke(variables, config=merged_config)
-            return response
+            return await invoke(variables, config=merged_config)
         except OutputParserException as e:
             # OutputParserException은 LLM 응답 파싱 실패를 의미
             llm_output = getattr(e, 'llm_output', 'N/A')
@@ -48,15 +48,19 @@ async def ainvoke_runnable(
                 f"  LLM 원본 출력: {llm_output}\n"
                 f"  원인: LLM이 유효한 JSON 형식으로 응답하지 않았습니다."
             )
-            last_error = error_msg
-            print(error_msg)
+            logger.error(error_msg)
             # OutputParserException은 재시도해도 같은 문제가 발생할 가능성이 높으므로 즉시 실패 처리
             raise RuntimeError(error_msg) from e
         except Exception as e:
-            last_error = f"[{step_label}] invoke 에러 (시도 {attempt + 1}/{MAX_RETRIES}): {e!s}"
-            print(last_error)
+            last_exc = e
+            # 메시지 포맷팅은 로그가 실제로 출력될 때만 수행
+            logger.warning("[%s] invoke 에러 (시도 %d/%d): %s", step_label, attempt + 1, MAX_RETRIES, e)
             if attempt < MAX_RETRIES - 1:
                 await asyncio.sleep(DELAY)
     
     # 모든 재시도 실패 시 RuntimeError 발생
-    raise RuntimeError(last_error or f"[{step_label}] 체인 실행 실패")
\ No newline at end of file
+    if last_exc is None:
+        raise RuntimeError(f"[{step_label}] 체인 실행 실패")
+    raise RuntimeError(
+        f"[{step_label}] invoke 에러 (시도 {MAX_RETRIES}/{MAX_RETRIES}): {last_exc!s}"
+    ) from last_exc
\ No newline at end of file
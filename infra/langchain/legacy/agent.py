@@ -7,6 +7,8 @@ Function Calling 방식 사용 (OpenAI Tools Agent)
 참고: 이 모듈은 레거시입니다. 새로운 기능은 chain을 사용하세요.
 """
 
+import os
+from functools import lru_cache
 from typing import Optional, Dict, Any
 from uuid import UUID
 from langchain_core.runnables import Runnable
@@ -14,45 +16,48 @@ from langchain.agents import create_openai_tools_agent, AgentExecutor
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from infra.langchain.config.llm import get_llm
 from infra.langchain.config.executor import ainvoke_runnable
-from infra.langchain.config.context import set_run_id
+from infra.langchain.config.context import (
+    set_run_id,
+    begin_run_memory_cache,
+    end_run_memory_cache
+)
 from infra.langchain.prompts import (
     get_human_input,
     get_agent_prompt,
-    create_human_message_with_image
+    get_system_content,
+    create_human_message_with_image,
+    register_prompt_reload_hook
 )
 from infra.langchain.tools import get_tools_for_label, get_tool_choice_for_label
 
+# AgentExecutor verbose 출력 (매 스텝 프롬프트/응답 전체를 stdout에 출력하므로 기본 비활성화)
+LANGCHAIN_AGENT_VERBOSE = os.getenv("LANGCHAIN_AGENT_VERBOSE", "false").lower() == "true"
 
-def get_agent(label: str = "chat-test", use_vision: bool = False) -> Runnable:
+
+def _bind_llm(llm: Any, tools: list, tool_choice: Any) -> Any:
     """
-    Agent 인스턴스를 생성합니다.
-    
-    Args:
-        label: 프롬프트 레이블
-        use_vision: Vision 모델 사용 여부
+    tool_choice 설정에 따라 LLM에 도구를 bind합니다.
+    "none"이면 bind하지 않고, "auto"/None이면 tools가 있을 때만 기본 bind합니다.
     """
-    # Vision이 필요한 경우 gpt-4o 사용
-    model = "gpt-4o" if use_vision else "gpt-4o-mini"
-    llm = get_llm(model=model)
-    tools = get_tools_for_label(label)
-    tool_choice = get_tool_choice_for_label(label)
-
-    # tool_choice가 설정되어 있으면 LLM에 bind
-    # "none"이면 도구를 bind하지 않음
     if tool_choice == "none":
-        pass  # 도구 사용 안 함
-    elif tool_choice and tool_choice != "auto":
-        llm = llm.bind_tools(tools, tool_choice=tool_choice)
-    elif tools:
+        return llm  # 도구 사용 안 함
+    if tool_choice and tool_choice != "auto":
+        return llm.bind_tools(tools, tool_choice=tool_choice)
+    if tools:
         # tools가 있고 tool_choice가 "auto"이면 기본적으로 bind
-        llm = llm.bind_tools(tools)
+        return llm.bind_tools(tools)
+    return llm
+
 
-    prompt = get_agent_prompt(label=label)
+def _build_agent_executor(label: str, model: str, prompt: ChatPromptTemplate) -> AgentExecutor:
+    """label의 도구 설정과 주어진 프롬프트로 AgentExecutor를 생성합니다."""
+    tools = get_tools_for_label(label)
+    llm = _bind_llm(get_llm(model=model), tools, get_tool_choice_for_label(label))
     agent = create_openai_tools_agent(llm, tools, prompt)
     agent_executor = AgentExecutor(
         agent=agent,
         tools=tools,
-        verbose=True,
+        verbose=LANGCHAIN_AGENT_VERBOSE,
         max_iterations=3,
         max_execution_time=30,
         return_intermediate_steps=True,  # final_response tool 호출 확인용
@@ -60,6 +65,42 @@ def get_agent(label: str = "chat-test", use_vision: bool = False) -> Runnable:
     return agent_executor
 
 
+@lru_cache(maxsize=32)
+def get_agent(label: str = "chat-test", use_vision: bool = False) -> Runnable:
+    """
+    Agent 인스턴스를 생성합니다.
+    label의 도구·tool_choice는 고정이므로 (label, use_vision) 단위로 캐시해
+    bind_tools의 도구 스키마 변환을 반복하지 않습니다.
+    
+    Args:
+        label: 프롬프트 레이블
+        use_vision: Vision 모델 사용 여부
+    """
+    # Vision이 필요한 경우 gpt-4o 사용
+    model = "gpt-4o" if use_vision else "gpt-4o-mini"
+    return _build_agent_executor(label, model, get_agent_prompt(label=label))
+
+
+@lru_cache(maxsize=32)
+def _get_vision_agent(label: str) -> Runnable:
+    """
+    이미지 입력용 Agent를 생성합니다.
+    {input} 대신 이미지가 포함된 HumanMessage를 human_message로 직접 전달받습니다.
+    """
+    custom_prompt = ChatPromptTemplate.from_messages([
+        ("system", get_system_content(label) or "You are a helpful assistant."),
+        MessagesPlaceholder(variable_name="human_message"),
+        MessagesPlaceholder(variable_name="agent_scratchpad"),
+    ])
+    return _build_agent_executor(label, "gpt-4o", custom_prompt)
+
+
+
+# 프롬프트 재로딩 시 캐시된 Agent도 다시 생성
+register_prompt_reload_hook(get_agent.cache_clear)
+register_prompt_reload_hook(_get_vision_agent.cache_clear)
+
+
 async def run_agent(
     label: str = "chat-test",
     image_base64: Optional[str] = None,
@@ -78,14 +119,13 @@ async def run_agent(
     Returns:
         Agent 실행 결과 문자열
     """
+    # run_memory 툴 캐시는 이 호출 동안만 유지
+    cache_token = begin_run_memory_cache()
     try:
         # run_id가 제공되면 context에 설정
         if run_id:
             set_run_id(run_id)
         
-        use_vision = image_base64 is not None
-        agent_executor = get_agent(label=label, use_vision=use_vision)
-        
         if image_base64:
             # 이미지가 있는 경우 HumanMessage 직접 생성
             human_message = create_human_message_with_image(
@@ -94,45 +134,9 @@ async def run_agent(
                 auxiliary_data=auxiliary_data
             )
             
-            # 프롬프트를 가져와서 system 내용 추출 (custom_prompt용)
-            prompt_template = get_agent_prompt(label=label)
-            
-            # AgentExecutor는 내부적으로 프롬프트를 사용하므로,
-            # 메시지를 직접 전달하기 위해 Runnable을 직접 invoke
-            # 하지만 AgentExecutor는 variables를 기대하므로, 
-            # 프롬프트를 수정하여 이미지를 포함시켜야 함
-            # 임시 해결책: 프롬프트를 동적으로 수정
-            from langchain_core.messages import SystemMessage
-            system_content = prompt_template.messages[0].content if hasattr(prompt_template.messages[0], 'content') else ""
-            
-            # 새로운 프롬프트 생성 (이미지 포함)
-            custom_prompt = ChatPromptTemplate.from_messages([
-                ("system", system_content),
-                MessagesPlaceholder(variable_name="human_message"),
-                MessagesPlaceholder(variable_name="agent_scratchpad"),
-            ])
-            
-            # Agent를 다시 생성 (커스텀 프롬프트 사용)
-            model = "gpt-4o"
-            llm = get_llm(model=model)
-            tools = get_tools_for_label(label)
-            tool_choice = get_tool_choice_for_label(label)
-            # tool_choice가 "none"이 아니고 "auto"가 아닐 때만 bind_tools
-            if tool_choice and tool_choice != "auto" and tool_choice != "none":
-                llm = llm.bind_tools(tools, tool_choice=tool_choice)
-            elif tool_choice != "none" and tools:
-                # tools가 있고 tool_choice가 "none"이 아니면 기본적으로 bind
-                llm = llm.bind_tools(tools)
-            
-            agent = create_openai_tools_agent(llm, tools, custom_prompt)
-            agent_executor = AgentExecutor(
-                agent=agent,
-                tools=tools,
-                verbose=True,
-                max_iterations=3,
-                max_execution_time=30,
-                return_intermediate_steps=True,
-            )
+            # AgentExecutor는 {input} 변수를 기대하므로, 이미지 메시지를 직접 받는
+            # 전용 프롬프트로 Agent를 한 번만 생성
+            agent_executor = _get_vision_agent(label)
             
             # 메시지 직접 전달
             result = await ainvoke_runnable(
@@ -142,6 +146,7 @@ async def run_agent(
             )
         else:
             # 기존 방식 (텍스트만)
+            agent_executor = get_agent(label=label)
             human_input = get_human_input(label)
             result = await ainvoke_runnable(
                 runnable=agent_executor,
@@ -152,13 +157,13 @@ async def run_agent(
         # final_response tool이 호출되었는지 확인
         if isinstance(result, dict):
             # return_intermediate_steps=True이면 intermediate_steps에 tool 호출 기록이 있음
-            if "intermediate_steps" in result:
-                for action, observation in result["intermediate_steps"]:
-                    # action.tool이 "final_response"인지 확인
-                    if hasattr(action, "tool") and action.tool == "final_response":
-                        # observation이 dict이고 "response" 키가 있으면 사용
-                        if isinstance(observation, dict) and "response" in observation:
-                            return str(observation["response"])
+            # final_response는 마지막에 호출되는 도구이므로 뒤에서부터 탐색
+            for action, observation in reversed(result.get("intermediate_steps") or ()):
+                # action.tool이 "final_response"인지 확인
+                if getattr(action, "tool", None) == "final_response":
+                    # observation이 dict이고 "response" 키가 있으면 사용
+                    if isinstance(observation, dict) and "response" in observation:
+                        return str(observation["response"])
             
             # final_response가 없으면 일반 output 반환
             if "output" in result:
@@ -167,4 +172,6 @@ async def run_agent(
         return str(result)
     except Exception as e:
         # 모든 예외를 RuntimeError로 변환
-        raise RuntimeError(f"Agent 실행 실패: {e}") from e
\ No newline at end of file
+        raise RuntimeError(f"Agent 실행 실패: {e}") from e
+    finally:
+        end_run_memory_cache(cache_token)
\ No newline at end of file
@@ -1,11 +1,15 @@
 """run_memory·filter-action 툴 (view_memory, update_memory, save_action, final_response)."""
+import logging
 from langchain_core.tools import tool
 from pydantic import BaseModel, Field
 from typing import List, Dict, Any, Optional
-from infra.langchain.config.context import get_run_id, get_from_node_id
+from infra.langchain.config.context import get_run_id, get_from_node_id, get_run_memory_cache
 from repositories.ai_memory_repository import (
     view_run_memory, update_run_memory, create_pending_action
 )
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
 
 
 @tool
@@ -20,10 +24,15 @@ def view_memory() -> dict:
     run_id = get_run_id()
     if not run_id:
         return {"error": "run_id가 설정되지 않았습니다."}
+    # run_agent 실행 중이면 같은 run에서 이미 읽거나 쓴 내용을 재사용
+    cache = get_run_memory_cache()
+    if cache is not None and run_id in cache:
+        return dict(cache[run_id])
     result = view_run_memory(run_id)
-    if result and "content" in result:
-        return result["content"]
-    return {}
+    content = result["content"] if result and "content" in result else {}
+    if cache is not None:
+        cache[run_id] = content
+    return dict(content)
 
 @tool
 def update_memory(content: dict) -> dict:
@@ -51,7 +60,11 @@ def update_memory(content: dict) -> dict:
         return {"error": "run_id가 설정되지 않았습니다."}
     if not content or not isinstance(content, dict):
         return {"error": "content는 비어있지 않은 딕셔너리여야 합니다."}
-    return update_run_memory(run_id, content)
+    result = update_run_memory(run_id, content)
+    cache = get_run_memory_cache()
+    if cache is not None:
+        cache[run_id] = result.get("content", content)
+    return result
 
 class ActionDict(BaseModel):
     """액션 딕셔너리 스키마 (save_action 툴용)"""
@@ -158,11 +171,14 @@ def final_response(actions: List[Dict[str, Any]]) -> dict:
     Returns:
         {"actions": [...]} 형태의 딕셔너리
     """
-    print(f"[FinalResponse] 처리 가능한 액션 {len(actions)}개 반환")
+    logger.debug("[FinalResponse] 처리 가능한 액션 %d개 반환", len(actions))
     # 디버깅: 첫 번째 액션의 필드 확인
-    if actions:
+    if actions and logger.isEnabledFor(logging.DEBUG):
         first_action = actions[0]
-        print(f"[FinalResponse] 첫 번째 액션 필드: role={first_action.get('role')}, name={first_action.get('name')}, selector={first_action.get('selector')}")
+        logger.debug(
+            "[FinalResponse] 첫 번째 액션 필드: role=%s, name=%s, selector=%s",
+            first_action.get("role"), first_action.get("name"), first_action.get("selector"),
+        )
     return {"actions": actions}
 
 
@@ -4,26 +4,58 @@ prompts 폴더: system/human 프롬프트 로드.
 - get_human_input(label): human/{label}.txt 내용 반환 (사전 세팅용 input)
 - get_system_content(label): system/{label}.txt 내용 반환
 - get_agent_prompt(label): Agent용 ChatPromptTemplate (system/{label}.txt 기반, agent_scratchpad 포함)
-- get_chain_prompt(label): Chain용 ChatPromptTemplate (system/{label}.txt 기반, agent_scratchpad 없음)
+- get_chain_prompt(label, format_instructions): Chain용 ChatPromptTemplate (system/{label}.txt 기반, agent_scratchpad 없음)
+- get_chain_system_content(label, format_instructions): Chain용 system 메시지 (format_instructions 이스케이프 포함)
 - create_human_message_with_image(label, image_base64, auxiliary_data): 이미지 포함 human 메시지 생성
+- reload_prompts(): 프롬프트 캐시 초기화 (개발 중 파일 수정 반영용)
+- register_prompt_reload_hook(hook): 프롬프트 기반 캐시(chain, agent 등)를 reload_prompts()에 연결
+
+human/system 프롬프트 파일은 import 시 한 번 메모리로 읽어 두고 (요청 경로에서 파일 I/O 없음),
+파생 템플릿은 캐시됩니다. 파일 수정 시 reload_prompts()를 호출하세요.
 """
 
 import os
-from typing import Optional, Dict, Any
+from functools import lru_cache
+from typing import Callable, List, Optional, Dict, Any
 
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain_core.messages import HumanMessage
 
 _PROMPT_DIR = os.path.dirname(os.path.abspath(__file__))
+_HUMAN_DIR = os.path.join(_PROMPT_DIR, "human")
+_SYSTEM_DIR = os.path.join(_PROMPT_DIR, "system")
+_DEFAULT_SYSTEM_CONTENT = "You are a helpful assistant."
+# human 메시지에 보조 자료를 덧붙일 때 쓰는 머리말
+AUXILIARY_DATA_HEADER = "\n\n보조 정보:\n"
+
+
+def _load_prompt_dir(directory: str) -> Dict[str, str]:
+    """directory/*.txt 를 모두 읽어 {label: 내용} 딕셔너리로 반환 (디렉터리가 없으면 빈 딕셔너리)."""
+    prompts: Dict[str, str] = {}
+    try:
+        entries = os.scandir(directory)
+    except FileNotFoundError:
+        return prompts
+    with entries:
+        for entry in entries:
+            if entry.is_file() and entry.name.endswith(".txt"):
+                with open(entry.path, encoding="utf-8") as f:
+                    prompts[entry.name[:-4]] = f.read().strip()
+    return prompts
+
+
+# label → 프롬프트 내용 (import 시 로드)
+_HUMAN_PROMPTS: Dict[str, str] = _load_prompt_dir(_HUMAN_DIR)
+_SYSTEM_PROMPTS: Dict[str, str] = _load_prompt_dir(_SYSTEM_DIR)
 
 
 def get_human_input(label: str) -> str:
-    """prompts/human/{label}.txt 내용을 읽어 반환 (사전 세팅용 input 값)."""
-    path = os.path.join(_PROMPT_DIR, "human", f"{label}.txt")
-    if not os.path.isfile(path):
+    """prompts/human/{label}.txt 내용을 반환 (사전 세팅용 input 값)."""
+    content = _HUMAN_PROMPTS.get(label)
+    if content is None:
+        path = os.path.join(_HUMAN_DIR, f"{label}.txt")
         raise FileNotFoundError(f"Human prompt '{label}' not found at {path}")
-    with open(path, encoding="utf-8") as f:
-        return f.read().strip()
+    return content
 
 
 def create_human_message_with_image(
@@ -44,12 +76,10 @@ def create_human_message_with_image(
     """
     text_prompt = get_human_input(label)
     
-    # 보조 자료가 있으면 텍스트에 추가
+    # 보조 자료가 있으면 텍스트에 추가 (한 번에 join)
     if auxiliary_data:
-        auxiliary_text = "\n\n보조 정보:\n"
-        for key, value in auxiliary_data.items():
-            auxiliary_text += f"- {key}: {value}\n"
-        text_prompt += auxiliary_text
+        auxiliary_lines = "".join(f"- {key}: {value}\n" for key, value in auxiliary_data.items())
+        text_prompt = f"{text_prompt}{AUXILIARY_DATA_HEADER}{auxiliary_lines}"
     
     # base64 이미지 URL 형식으로 변환
     if not image_base64.startswith("data:image"):
@@ -72,7 +102,7 @@ def create_human_message_with_image(
 
 def get_system_content(label: str) -> str:
     """
-    prompts/system/{label}.txt 내용을 읽어 반환합니다.
+    prompts/system/{label}.txt 내용을 반환합니다.
     
     Args:
         label: 프롬프트 레이블 (파일명)
@@ -80,13 +110,31 @@ def get_system_content(label: str) -> str:
     Returns:
         system 프롬프트 내용 (파일이 없으면 빈 문자열)
     """
-    path_system = os.path.join(_PROMPT_DIR, "system", f"{label}.txt")
-    if os.path.isfile(path_system):
-        with open(path_system, encoding="utf-8") as f:
-            return f.read().strip()
-    return ""
+    return _SYSTEM_PROMPTS.get(label, "")
+
+
+@lru_cache(maxsize=64)
+def get_chain_system_content(label: str, format_instructions: Optional[str] = None) -> str:
+    """
+    Chain용 system 메시지 내용을 반환합니다.
+    format_instructions가 있으면 중괄호를 이스케이프해 (LangChain 템플릿 변수로
+    해석되지 않도록) system 프롬프트 뒤에 붙입니다.
+    
+    Args:
+        label: 프롬프트 레이블 (파일명)
+        format_instructions: Parser의 format_instructions (선택적)
+    
+    Returns:
+        system 메시지 내용
+    """
+    system_content = get_system_content(label) or _DEFAULT_SYSTEM_CONTENT
+    if not format_instructions:
+        return system_content
+    escaped_format_instructions = format_instructions.replace("{", "{{").replace("}", "}}")
+    return f"{system_content}\n\n{escaped_format_instructions}"
 
 
+@lru_cache(maxsize=64)
 def get_agent_prompt(label: str = "chat-test") -> ChatPromptTemplate:
     """
     prompts/system/{label}.txt 를 읽어 Agent용 ChatPromptTemplate을 반환합니다.
@@ -102,13 +150,17 @@ def get_agent_prompt(label: str = "chat-test") -> ChatPromptTemplate:
     system_content = get_system_content(label)
     
     return ChatPromptTemplate.from_messages([
-        ("system", system_content or "You are a helpful assistant."),
+        ("system", system_content or _DEFAULT_SYSTEM_CONTENT),
         ("human", "{input}"),
         MessagesPlaceholder(variable_name="agent_scratchpad"),
     ])
 
 
-def get_chain_prompt(label: str = "filter-action") -> ChatPromptTemplate:
+@lru_cache(maxsize=64)
+def get_chain_prompt(
+    label: str = "filter-action",
+    format_instructions: Optional[str] = None
+) -> ChatPromptTemplate:
     """
     prompts/system/{label}.txt 를 읽어 Chain용 ChatPromptTemplate을 반환합니다.
     Agent용과 달리 agent_scratchpad가 없습니다.
@@ -118,13 +170,33 @@ def get_chain_prompt(label: str = "filter-action") -> ChatPromptTemplate:
 
     Args:
         label: 프롬프트 레이블 (파일명). 예: "filter-action"
+        format_instructions: Parser의 format_instructions (있으면 system 프롬프트에 추가)
 
     Returns:
         ChatPromptTemplate (get_chain용, agent_scratchpad 없음)
     """
-    system_content = get_system_content(label)
-    
     return ChatPromptTemplate.from_messages([
-        ("system", system_content or "You are a helpful assistant."),
+        ("system", get_chain_system_content(label, format_instructions)),
         ("human", "{input}"),
     ])
+
+
+# reload_prompts() 시 함께 비울 외부 캐시 (프롬프트로 만든 chain/agent 캐시 등)
+_reload_hooks: List[Callable[[], None]] = []
+
+
+def register_prompt_reload_hook(hook: Callable[[], None]) -> None:
+    """reload_prompts() 호출 시 실행할 캐시 초기화 함수를 등록합니다 (예: get_chain.cache_clear)."""
+    _reload_hooks.append(hook)
+
+
+def reload_prompts() -> None:
+    """프롬프트 파일을 디스크에서 다시 읽고, 캐시된 템플릿과 등록된 파생 캐시를 모두 비웁니다."""
+    global _HUMAN_PROMPTS, _SYSTEM_PROMPTS
+    _HUMAN_PROMPTS = _load_prompt_dir(_HUMAN_DIR)
+    _SYSTEM_PROMPTS = _load_prompt_dir(_SYSTEM_DIR)
+    get_chain_system_content.cache_clear()
+    get_agent_prompt.cache_clear()
+    get_chain_prompt.cache_clear()
+    for hook in _reload_hooks:
+        hook()
@@ -9,12 +9,20 @@ LLM Chain 방식 사용 (Prompt → LLM → OutputParser)
 - run_chain(label, variables, ...): Chain 실행
 """
 
+from functools import lru_cache
 from typing import Optional, Dict, Any
 from langchain_core.runnables import Runnable
 from langchain_core.messages import HumanMessage
 from infra.langchain.config.llm import get_llm
 from infra.langchain.config.executor import ainvoke_runnable
-from infra.langchain.prompts import get_human_input, get_chain_prompt, create_human_message_with_image
+from infra.langchain.prompts import (
+    get_human_input,
+    get_chain_prompt,
+    get_chain_system_content,
+    create_human_message_with_image,
+    register_prompt_reload_hook,
+    AUXILIARY_DATA_HEADER,
+)
 from infra.langchain.config.parser import get_parser
 from infra.langchain.runnables.formatters import get_input_formatter, has_input_formatter
 
@@ -25,9 +33,12 @@ from infra.langchain.runnables.formatters import process_pending_actions  # noqa
 from infra.langchain.runnables.formatters import guess_intent  # noqa: F401
 
 
+@lru_cache(maxsize=32)
 def get_chain(label: str = "filter-action", use_vision: bool = False) -> Runnable:
     """
     Chain 인스턴스를 생성합니다.
+    Chain은 상태가 없으므로 (label, use_vision) 단위로 캐시해 재사용합니다.
+    reload_prompts() 호출 시 캐시도 함께 비워집니다.
     
     Args:
         label: 프롬프트 레이블
@@ -43,27 +54,10 @@ def get_chain(label: str = "filter-action", use_vision: bool = False) -> Runnabl
     # Parser 가져오기 (있는 경우)
     parser = get_parser(label)
     
-    # Chain용 프롬프트 생성 (agent_scratchpad 없음)
+    # Chain용 프롬프트 생성 (agent_scratchpad 없음, (label, format_instructions) 단위로 캐시됨)
     # Parser가 있으면 format_instructions를 시스템 프롬프트에 추가
-    if parser:
-        from infra.langchain.prompts import get_system_content
-        from langchain_core.prompts import ChatPromptTemplate
-        
-        system_content = get_system_content(label)
-        format_instructions = parser.get_format_instructions()
-        
-        # format_instructions의 중괄호를 이스케이프 (LangChain 템플릿 변수로 해석되지 않도록)
-        escaped_format_instructions = format_instructions.replace("{", "{{").replace("}", "}}")
-        
-        # format_instructions를 시스템 프롬프트에 추가
-        full_system_content = f"{system_content or 'You are a helpful assistant.'}\n\n{escaped_format_instructions}"
-        
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", full_system_content),
-            ("human", "{input}"),
-        ])
-    else:
-        prompt = get_chain_prompt(label=label)
+    format_instructions = parser.get_format_instructions() if parser else None
+    prompt = get_chain_prompt(label=label, format_instructions=format_instructions)
     
     # Chain 구성: Prompt → LLM → (Parser)
     if parser:
@@ -75,6 +69,10 @@ def get_chain(label: str = "filter-action", use_vision: bool = False) -> Runnabl
     return chain
 
 
+# 프롬프트 재로딩 시 캐시된 Chain도 다시 생성
+register_prompt_reload_hook(get_chain.cache_clear)
+
+
 async def run_chain(
     label: str = "filter-action",
     variables: Optional[Dict[str, Any]] = None,
@@ -141,21 +139,19 @@ async def run_chain(
                 
                 # 보조 자료가 있으면 텍스트에 추가
                 if auxiliary_data:
-                    auxiliary_text = "\n\n보조 정보:\n"
+                    auxiliary_lines = [AUXILIARY_DATA_HEADER]
+                    append = auxiliary_lines.append
                     for key, value in auxiliary_data.items():
                         if isinstance(value, list):
                             # 리스트는 요약해서 표시
                             if len(value) > 10:
-                                auxiliary_text += f"- {key}: {len(value)}개 항목 (처음 10개만 표시)\n"
-                                for item in value[:10]:
-                                    auxiliary_text += f"  * {str(item)[:100]}\n"
+                                append(f"- {key}: {len(value)}개 항목 (처음 10개만 표시)\n")
                             else:
-                                auxiliary_text += f"- {key}:\n"
-                                for item in value:
-                                    auxiliary_text += f"  * {str(item)[:100]}\n"
+                                append(f"- {key}:\n")
+                            auxiliary_lines.extend(f"  * {str(item)[:100]}\n" for item in value[:10])
                         else:
-                            auxiliary_text += f"- {key}: {value}\n"
-                    formatted_text += auxiliary_text
+                            append(f"- {key}: {value}\n")
+                    formatted_text += "".join(auxiliary_lines)
             
             # 이미지가 있는 경우 특별 처리
             if image_base64:
@@ -181,19 +177,11 @@ async def run_chain(
                 # 이미지가 포함된 메시지는 메시지 리스트로 전달
                 # 프롬프트 템플릿의 {input} 플레이스홀더 대신 메시지를 직접 사용
                 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
-                from infra.langchain.prompts import get_system_content
-                
-                system_content = get_system_content(label)
                 
                 # Parser가 있으면 format_instructions 추가
                 parser = get_parser(label)
-                if parser:
-                    format_instructions = parser.get_format_instructions()
-                    # format_instructions의 중괄호를 이스케이프 (LangChain 템플릿 변수로 해석되지 않도록)
-                    escaped_format_instructions = format_instructions.replace("{", "{{").replace("}", "}}")
-                    full_system_content = f"{system_content or 'You are a helpful assistant.'}\n\n{escaped_format_instructions}"
-                else:
-                    full_system_content = system_content or "You are a helpful assistant."
+                format_instructions = parser.get_format_instructions() if parser else None
+                full_system_content = get_chain_system_content(label, format_instructions)
                 
                 # 이미지용 프롬프트 템플릿 생성 (메시지 직접 전달)
                 image_prompt = ChatPromptTemplate.from_messages([
@@ -201,10 +189,9 @@ async def run_chain(
                     MessagesPlaceholder(variable_name="messages"),
                 ])
                 
-                # 이미지용 chain 재구성 (LLM과 Parser 재사용)
+                # 이미지용 chain 재구성 (위에서 조회한 Parser 재사용)
                 model = "gpt-4o"  # 이미지가 있으면 항상 gpt-4o 사용
                 llm = get_llm(model=model)
-                parser = get_parser(label)
                 
                 if parser:
                     image_chain = image_prompt | llm | parser
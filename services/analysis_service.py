@@ -311,10 +311,11 @@ class AnalysisService:
         return evaluate_doing_actions(chain_data)
 
     @staticmethod
-    def analyze_transition(edge_id, edge_data=None, prev_node_data=None, next_node_data=None):
+    def analyze_transition(edge_id, edge_data=None, prev_node_data=None, next_node_data=None, element_index_cache=None):
         """
         이동(액션 직후 피드백) 분석 수행.
         데이터가 제공되면 로딩 및 요소 추출 과정을 건너뜁니다.
+        element_index_cache가 주어지면 같은 노드의 요소 인덱스를 엣지 간에 재사용합니다.
         """
         try:
             # Check if we have the minimum required data (edge and prev_node)
@@ -363,7 +364,7 @@ class AnalysisService:
             if edge_data is not None and prev_node_data is not None:
                 print("\n--- Evaluating Visibility of System Status ---")
                 # next_node_data can be None or {}
-                results = evaluate_after_action(edge_data, prev_node_data, next_node_data or {})
+                results = evaluate_after_action(edge_data, prev_node_data, next_node_data or {}, element_index_cache)
                 
                 eff = results.get("efficiency", {})
                 lat = eff.get("latency", {})
@@ -450,6 +451,8 @@ class AnalysisService:
         # 4. 전이 분석 (After Action - Latency & Feedback)
         print("\n[4] Running Transition Analysis (Latency & Feedback)...")
         transition_results = []
+        # 노드별 요소 인덱스 캐시 (node_cache의 노드 데이터는 변경하지 않음)
+        element_index_cache = {}
         
         for edge in edges_raw:
             edge_id = str(edge.get('id'))
@@ -460,7 +463,10 @@ class AnalysisService:
             next_data = node_cache.get(to_id, {})
             
             try:
-                eval_res = AnalysisService.analyze_transition(edge_id=edge_id, edge_data=edge, prev_node_data=prev_data, next_node_data=next_data)
+                eval_res = AnalysisService.analyze_transition(
+                    edge_id=edge_id, edge_data=edge, prev_node_data=prev_data, next_node_data=next_data,
+                    element_index_cache=element_index_cache
+                )
                 if eval_res:
                     transition_results.append({
                         "edge_id": edge_id,